@@ -5,7 +5,9 @@ Use this to start the server locally
 
 if __name__ == "__main__":
     import uvicorn
-    from src.config import settings
+    from src.config import get_settings
+    
+    settings = get_settings()
     
     print("=" * 60)
     print("🚀 AI Image Analyzer - Starting Server")
@@ -13,14 +15,25 @@ if __name__ == "__main__":
     print(f"📡 Host: {settings.HOST}")
     print(f"🔌 Port: {settings.PORT}")
     print(f"🐛 Debug: {settings.DEBUG}")
+    print(f"👷 Workers: {settings.workers}")
     print(f"🎭 Demo Mode: {settings.DEMO_MODE}")
-    print(f"🔑 API Key: {'✅ Configured' if settings.GEMINI_API_KEY and settings.GEMINI_API_KEY != 'your_gemini_api_key_here' else '❌ Not configured'}")
+    print(f"🔑 API Key: {'✅ Configured' if settings.api_key_valid else '❌ Not configured'}")
     print("=" * 60)
     print()
     
+    # Reload only works with a single worker process
+    reload = settings.DEBUG and settings.workers == 1
+    if settings.DEBUG and not reload:
+        print("⚠️  Auto-reload disabled: set WEB_CONCURRENCY=1 to enable it")
+        print()
+    
+    # "auto" picks uvloop/httptools when installed (not available on Windows)
     uvicorn.run(
         "src.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        workers=settings.workers,
+        loop="auto",
+        http="auto",
+        reload=reload
     )
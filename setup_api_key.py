@@ -13,19 +13,19 @@ def setup_api_key():
     print("=" * 60)
     print()
     
-    # Check if .env exists
+    # Read current content, creating .env if it doesn't exist
     env_file = Path(".env")
     
-    if not env_file.exists():
+    try:
+        current_content = env_file.read_text()
+    except FileNotFoundError:
         print("❌ .env file not found!")
         print("Creating .env file...")
-        env_file.write_text("GEMINI_API_KEY=your_gemini_api_key_here\n")
+        current_content = "GEMINI_API_KEY=your_gemini_api_key_here\n"
+        env_file.write_text(current_content)
         print("✅ Created .env file")
         print()
     
-    # Read current content
-    current_content = env_file.read_text()
-    
     # Check if key is configured
     if "your_gemini_api_key_here" in current_content or "GEMINI_API_KEY=" not in current_content:
         print("⚠️  API key not configured yet!")
@@ -3,7 +3,9 @@ Configuration settings for AI Image Analyzer
 Uses Pydantic BaseSettings for environment variable management
 """
 
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
 
@@ -15,10 +17,12 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = False  # Set to False for production
+    WEB_CONCURRENCY: Optional[int] = None  # Uvicorn worker processes (default: 1 in DEBUG, else 2)
     
     # API Configuration
     GEMINI_API_KEY: Optional[str] = None
     DEMO_MODE: bool = False  # Disabled by default - use real API
+    USE_AGENT: bool = False  # Route analysis through the LangChain agent loop
     
     # Application Info
     APP_NAME: str = "AI Image Analyzer"
@@ -26,22 +30,39 @@ class Settings(BaseSettings):
     APP_DESCRIPTION: str = "Analyze images using LangChain and Google Gemini AI"
     
     # CORS Configuration
-    CORS_ORIGINS: list = ["*"]
+    CORS_ORIGINS: tuple[str, ...] = ("*",)
     
     # Logging
     LOG_LEVEL: str = "INFO"
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+        validate_default=True,
+    )
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @field_validator("PORT", mode="before")
+    @classmethod
+    def _port_env(cls, v):
         # Override PORT from environment if available (for deployment platforms)
-        if os.getenv("PORT"):
-            self.PORT = int(os.getenv("PORT"))
+        return int(os.getenv("PORT", v))
+    
+    @property
+    def workers(self) -> int:
+        """Uvicorn worker count - a single reloadable worker in DEBUG unless overridden"""
+        if self.WEB_CONCURRENCY:
+            return self.WEB_CONCURRENCY
+        return 1 if self.DEBUG else 2
+    
+    @cached_property
+    def api_key_valid(self) -> bool:
+        """Whether a real Gemini API key is configured (checked once per instance)"""
+        return bool(self.GEMINI_API_KEY) and self.GEMINI_API_KEY != "your_gemini_api_key_here"
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached settings instance (use with FastAPI Depends)"""
+    return Settings()
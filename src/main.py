@@ -3,34 +3,43 @@ AI Image Analyzer - FastAPI + LangChain + Gemini
 A powerful image analysis agent using LangChain and Google's Gemini AI
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import Depends, FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import Optional
+from functools import cached_property, lru_cache
+from contextvars import ContextVar
 import os
+import asyncio
 import base64
-from dotenv import load_dotenv
+import random
 from datetime import datetime
 import logging
-
-# LangChain imports
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.agents import AgentExecutor, create_structured_chat_agent
-from langchain.tools import Tool
-from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.schema import HumanMessage
-from langchain_core.messages import SystemMessage
+import logging.config
+import orjson
 
 # Import settings
-from src.config import settings
-
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(level=settings.LOG_LEVEL)
+from src.config import Settings, get_settings
+
+settings = get_settings()
+
+# Configure logging (level name resolved once here)
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {"format": "%(levelname)s:%(name)s:%(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "default"},
+    },
+    "root": {
+        "level": logging.getLevelName(settings.LOG_LEVEL),
+        "handlers": ["console"],
+    },
+})
 logger = logging.getLogger(__name__)
 
 # ============================================
@@ -39,16 +48,18 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
-    version=settings.APP_VERSION
+    version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_credentials=False,  # Credentials can't be combined with a "*" origin
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # ============================================
@@ -57,7 +68,13 @@ app.add_middleware(
 GEMINI_API_KEY = settings.GEMINI_API_KEY
 DEMO_MODE = settings.DEMO_MODE
 
-if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here":
+# The key never changes at runtime, so validate it once instead of per request
+API_KEY_VALID = settings.api_key_valid
+
+AGENT_NAME_REAL = "LangChain + Gemini 1.5 Flash"
+AGENT_NAME_DEMO = "DEMO MODE (Add API key for real analysis)"
+
+if not API_KEY_VALID:
     logger.warning("⚠️  GEMINI_API_KEY not configured!")
     if DEMO_MODE:
         logger.info("🎭 DEMO_MODE enabled - Using mock responses")
@@ -66,14 +83,8 @@ if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here":
 else:
     logger.info("✅ GEMINI_API_KEY configured")
 
-# Initialize Gemini model with vision capabilities (only if API key is valid)
-llm = None
-if GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here":
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        google_api_key=GEMINI_API_KEY,
-        temperature=0.7,
-    )
+# Gemini model with vision capabilities is built lazily by ImageAnalyzerAgent.llm
+# (only if API key is valid), so LangChain is never imported in demo mode
 
 # ============================================
 # PYDANTIC MODELS
@@ -88,15 +99,32 @@ class AnalysisResponse(BaseModel):
     timestamp: str
     agent_used: str = "LangChain + Gemini"
 
+# ============================================
+# TIMESTAMP CACHE
+# ============================================
+# Response timestamp, refreshed in the background instead of formatted per request
+TIMESTAMP_REFRESH_SECONDS = 0.2
+_NOW_ISO = datetime.now().isoformat(timespec="seconds")
+_timestamp_task: Optional[asyncio.Task] = None
+
+async def refresh_timestamp():
+    """Keep _NOW_ISO up to date while the server is running"""
+    global _NOW_ISO
+    while True:
+        _NOW_ISO = datetime.now().isoformat(timespec="seconds")
+        await asyncio.sleep(TIMESTAMP_REFRESH_SECONDS)
+
+def now_iso() -> str:
+    """Current response timestamp, formatted directly when the refresher isn't running (no lifespan)"""
+    if _timestamp_task is None or _timestamp_task.done():
+        return datetime.now().isoformat(timespec="seconds")
+    return _NOW_ISO
+
 # ============================================
 # DEMO MODE HELPER
 # ============================================
-def generate_mock_analysis() -> str:
-    """Generate a realistic mock analysis for demo mode"""
-    import random
-    
-    mock_responses = [
-        """**Main Subject**: The image features a vibrant outdoor scene with natural elements.
+_MOCK_RESPONSES: tuple[str, ...] = (
+    """**Main Subject**: The image features a vibrant outdoor scene with natural elements.
 
 **Visual Elements**: The composition showcases rich colors with excellent lighting. The color palette includes warm tones that create an inviting atmosphere. The image demonstrates good depth of field and professional framing.
 
@@ -107,8 +135,8 @@ def generate_mock_analysis() -> str:
 **Mood & Atmosphere**: The overall mood is uplifting and positive. The image conveys a sense of tranquility and natural beauty, evoking feelings of peace and harmony with nature.
 
 *Note: This is a DEMO response. Configure your GEMINI_API_KEY for real AI analysis.*""",
-        
-        """**Main Subject**: A captivating photograph showcasing interesting visual elements and composition.
+    
+    """**Main Subject**: A captivating photograph showcasing interesting visual elements and composition.
 
 **Visual Elements**: The image displays a harmonious blend of colors and textures. The lighting creates dynamic contrasts that draw the viewer's attention to key areas. The composition follows the rule of thirds, creating visual balance.
 
@@ -119,8 +147,8 @@ def generate_mock_analysis() -> str:
 **Mood & Atmosphere**: The image emanates a professional quality with artistic sensibility. It creates an emotional connection through its visual storytelling, leaving a lasting impression on the viewer.
 
 *Note: This is a DEMO response. Add your GEMINI_API_KEY to .env for actual AI-powered analysis.*""",
-        
-        """**Main Subject**: An engaging visual composition that captures attention through its subject matter and presentation.
+    
+    """**Main Subject**: An engaging visual composition that captures attention through its subject matter and presentation.
 
 **Visual Elements**: The photograph demonstrates excellent use of light and shadow. Colors are vibrant yet natural, creating visual interest. The composition is well-structured with clear focal points.
 
@@ -131,72 +159,165 @@ def generate_mock_analysis() -> str:
 **Mood & Atmosphere**: The overall feeling is one of authenticity and genuine moment capture. The image successfully communicates its intended message through visual language.
 
 *Note: This is a DEMO MODE response. For real AI analysis powered by Google Gemini, please add your API key to the .env file.*"""
-    ]
-    
-    return random.choice(mock_responses)
+)
+
+def generate_mock_analysis() -> str:
+    """Generate a realistic mock analysis for demo mode"""
+    return random.choice(_MOCK_RESPONSES)
+
+# Demo responses only differ by timestamp, so serialize them once with a
+# placeholder that is swapped for the real timestamp at send time
+_TIMESTAMP_PLACEHOLDER = b"__TIMESTAMP__"
+_DEMO_RESPONSES: tuple[bytes, ...] = tuple(
+    orjson.dumps({
+        "success": True,
+        "description": description,
+        "timestamp": _TIMESTAMP_PLACEHOLDER.decode(),
+        "agent_used": AGENT_NAME_DEMO,
+    })
+    for description in _MOCK_RESPONSES
+)
+
+def demo_response() -> Response:
+    """Return a pre-serialized mock AnalysisResponse for demo mode"""
+    content = random.choice(_DEMO_RESPONSES).replace(
+        _TIMESTAMP_PLACEHOLDER, now_iso().encode(), 1
+    )
+    return Response(content=content, media_type="application/json")
 
 # ============================================
 # IMAGE ANALYSIS AGENT
 # ============================================
+# Data URI of the image being analyzed by the current call; used by the agent
+# tool, which only receives the query string from LangChain
+_current_image_url: ContextVar[str] = ContextVar("current_image_url")
+
+# System message for image analysis
+_SYSTEM_MESSAGE = """You are an expert AI Image Analyzer powered by Google Gemini.
+Your role is to provide comprehensive, detailed analysis of images.
+
+When analyzing an image, you should:
+1. Identify the main subject and key elements
+2. Describe visual characteristics (colors, composition, lighting, style)
+3. Provide context about the setting or environment
+4. Note any interesting or unique details
+5. Describe the mood, atmosphere, or emotion conveyed
+
+Provide well-structured, engaging descriptions that are informative and easy to read.
+"""
+
+# Agent system message, which also has to steer the model to its tool
+_AGENT_SYSTEM_MESSAGE = _SYSTEM_MESSAGE + """
+Always use the 'analyze_image' tool to examine the uploaded image.
+"""
+
+# Default comprehensive analysis prompt
+_DEFAULT_PROMPT = """Analyze this image in detail and provide a comprehensive description. Include:
+
+1. **Main Subject**: What is the primary focus of the image?
+2. **Visual Elements**: Describe colors, composition, lighting, and style
+3. **Context & Setting**: Where does this appear to be? What's the environment?
+4. **Notable Details**: Any interesting or unique aspects worth mentioning
+5. **Mood & Atmosphere**: What feeling or emotion does the image convey?
+
+Please provide a well-structured, engaging description that captures all important aspects of the image."""
+
+@lru_cache(maxsize=1)
+def get_prompt_template():
+    """Build the agent prompt template once (imports LangChain on first use)"""
+    from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+    
+    return ChatPromptTemplate.from_messages([
+        ("system", _AGENT_SYSTEM_MESSAGE),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
 class ImageAnalyzerAgent:
     """LangChain Agent for analyzing images using Gemini AI"""
     
-    def __init__(self, llm_instance=None):
-        self.llm = llm_instance
-        self.current_image = None
-        self.current_mime_type = None
-        self.demo_mode = DEMO_MODE and (llm_instance is None)
-        
-    def set_image(self, image_base64: str, mime_type: str):
-        """Set the current image for analysis"""
-        self.current_image = image_base64
-        self.current_mime_type = mime_type
+    def __init__(
+        self,
+        llm_instance=None,
+        api_key: Optional[str] = None,
+        use_agent: bool = False,
+        demo_mode: bool = False,
+    ):
+        self._llm_instance = llm_instance
+        self.api_key = api_key
+        self.use_agent = use_agent
+        self._agent_executor = None
+        self.demo_mode = demo_mode and (llm_instance is None) and not api_key
     
-    def analyze_image_tool(self, query: str) -> str:
-        """Tool for analyzing the current image"""
-        if not self.current_image:
-            return "No image has been uploaded for analysis."
+    @cached_property
+    def llm(self):
+        """Gemini model with vision capabilities, built on first use"""
+        if self._llm_instance is not None:
+            return self._llm_instance
+        if not self.api_key:
+            return None
         
-        # Demo mode - return mock response
-        if self.demo_mode:
-            logger.info("🎭 Using DEMO MODE - Returning mock analysis")
-            return generate_mock_analysis()
+        from langchain_google_genai import ChatGoogleGenerativeAI
         
-        try:
-            # Create message with image
-            message = HumanMessage(
-                content=[
-                    {
-                        "type": "text",
-                        "text": query
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": f"data:{self.current_mime_type};base64,{self.current_image}"
-                    }
-                ]
-            )
-            
-            # Get response from Gemini
-            response = self.llm.invoke([message])
-            return response.content
-            
-        except Exception as e:
-            logger.error(f"Error in image analysis: {str(e)}")
-            return f"Error analyzing image: {str(e)}"
+        return ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash",
+            google_api_key=self.api_key,
+            temperature=0.7,
+        )
+    
+    def _image_message(self, query: str, image_url: str):
+        """Create the Gemini message carrying the query and the image"""
+        from langchain.schema import HumanMessage
+        
+        return HumanMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": query
+                },
+                {
+                    "type": "image_url",
+                    "image_url": image_url
+                }
+            ]
+        )
+    
+    def describe_image(self, prompt: str, image_url: str) -> str:
+        """Analyze the image with a single Gemini call, without the agent loop"""
+        from langchain_core.messages import SystemMessage
+        
+        response = self.llm.invoke([
+            SystemMessage(content=_SYSTEM_MESSAGE),
+            self._image_message(prompt, image_url),
+        ])
+        return response.content
+    
+    def _agent_image_tool(self, query: str) -> str:
+        """Agent tool entry point, analyzing the image of the current call"""
+        image_url = _current_image_url.get(None)
+        if image_url is None:
+            return "No image has been uploaded for analysis."
+        return self.describe_image(query, image_url)
     
     def create_agent(self):
-        """Create the LangChain agent with tools"""
+        """Create the LangChain agent with tools (built once, then reused)"""
         
         # In demo mode, skip agent creation
         if self.demo_mode:
             return None
         
+        if self._agent_executor is not None:
+            return self._agent_executor
+        
+        from langchain.agents import AgentExecutor, create_structured_chat_agent
+        from langchain.tools import Tool
+        
         # Define tools
         tools = [
             Tool(
                 name="analyze_image",
-                func=self.analyze_image_tool,
+                func=self._agent_image_tool,
                 description="""Use this tool to analyze the uploaded image. 
                 This tool can identify objects, describe scenes, read text, 
                 analyze colors, composition, mood, and provide detailed descriptions.
@@ -204,33 +325,11 @@ class ImageAnalyzerAgent:
             )
         ]
         
-        # Create agent prompt
-        system_message = """You are an expert AI Image Analyzer powered by Google Gemini.
-        Your role is to provide comprehensive, detailed analysis of images.
-        
-        When analyzing an image, you should:
-        1. Identify the main subject and key elements
-        2. Describe visual characteristics (colors, composition, lighting, style)
-        3. Provide context about the setting or environment
-        4. Note any interesting or unique details
-        5. Describe the mood, atmosphere, or emotion conveyed
-        
-        Always use the 'analyze_image' tool to examine the uploaded image.
-        Provide well-structured, engaging descriptions that are informative and easy to read.
-        """
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            MessagesPlaceholder(variable_name="chat_history", optional=True),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-        
         # Create agent
         agent = create_structured_chat_agent(
             llm=self.llm,
             tools=tools,
-            prompt=prompt
+            prompt=get_prompt_template()
         )
         
         # Create agent executor
@@ -242,12 +341,13 @@ class ImageAnalyzerAgent:
             max_iterations=3
         )
         
+        self._agent_executor = agent_executor
         return agent_executor
     
-    def analyze(self, custom_prompt: Optional[str] = None) -> str:
-        """Run the agent to analyze the image"""
+    def analyze(self, image_base64: str, mime_type: str, custom_prompt: Optional[str] = None) -> str:
+        """Run the agent to analyze the given image"""
         
-        if not self.current_image:
+        if not image_base64:
             raise ValueError("No image has been set for analysis")
         
         # Demo mode - return mock response directly
@@ -255,109 +355,143 @@ class ImageAnalyzerAgent:
             logger.info("🎭 DEMO MODE: Generating mock analysis")
             return generate_mock_analysis()
         
-        # Default comprehensive analysis prompt
-        default_prompt = """Analyze this image in detail and provide a comprehensive description. Include:
-
-1. **Main Subject**: What is the primary focus of the image?
-2. **Visual Elements**: Describe colors, composition, lighting, and style
-3. **Context & Setting**: Where does this appear to be? What's the environment?
-4. **Notable Details**: Any interesting or unique aspects worth mentioning
-5. **Mood & Atmosphere**: What feeling or emotion does the image convey?
-
-Please provide a well-structured, engaging description that captures all important aspects of the image."""
+        prompt = custom_prompt or _DEFAULT_PROMPT
+        
+        # Build the data URI once and pass it down to every Gemini call
+        image_url = f"data:{mime_type};base64,{image_base64}"
         
-        prompt = custom_prompt or default_prompt
+        # Single tool and fixed prompt - call Gemini directly unless the agent is requested
+        if not self.use_agent:
+            return self.describe_image(prompt, image_url)
         
-        # Create and run agent
+        # Get the cached agent and run it
         agent_executor = self.create_agent()
-        result = agent_executor.invoke({"input": prompt})
+        token = _current_image_url.set(image_url)
+        try:
+            result = agent_executor.invoke({"input": prompt})
+        finally:
+            _current_image_url.reset(token)
         
         return result["output"]
 
-# Initialize the agent
-image_agent = ImageAnalyzerAgent(llm)
+@lru_cache()
+def build_image_agent(settings: Settings) -> ImageAnalyzerAgent:
+    """Create the agent for a settings instance (the Gemini model itself is created on first analysis)"""
+    return ImageAnalyzerAgent(
+        api_key=settings.GEMINI_API_KEY if settings.api_key_valid else None,
+        use_agent=settings.USE_AGENT,
+        demo_mode=settings.DEMO_MODE
+    )
+
+async def get_image_agent(settings: Settings = Depends(get_settings)) -> ImageAnalyzerAgent:
+    """Return the cached agent for the injected settings (use with FastAPI Depends)"""
+    return build_image_agent(settings)
+
+# Initialize the agent for the application settings
+image_agent = build_image_agent(settings)
 
 # ============================================
 # API ENDPOINTS
 # ============================================
 
+# Fallback page used when no index.html is found
+FALLBACK_HTML = "<h1>AI Image Analyzer API</h1><p>Upload an image to /analyze endpoint</p>"
+
+def load_index_html() -> str:
+    """Read the main HTML page from disk (src directory first, then root)"""
+    html_paths = [
+        os.path.join(os.path.dirname(__file__), "index.html"),
+        "index.html"
+    ]
+    
+    for html_path in html_paths:
+        try:
+            with open(html_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.error("Error reading HTML: %s", e)
+            break
+    
+    # Fallback if no HTML found
+    return FALLBACK_HTML
+
+# Main HTML page, read once per worker at import
+_INDEX_HTML = load_index_html()
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main HTML page"""
-    try:
-        # Try to read from src directory first, then root
-        html_paths = [
-            os.path.join(os.path.dirname(__file__), "index.html"),
-            "index.html"
-        ]
-        
-        for html_path in html_paths:
-            if os.path.exists(html_path):
-                with open(html_path, "r", encoding="utf-8") as f:
-                    return HTMLResponse(content=f.read())
-        
-        # Fallback if no HTML found
-        return HTMLResponse(content="<h1>AI Image Analyzer API</h1><p>Upload an image to /analyze endpoint</p>")
-    except Exception as e:
-        logger.error(f"Error serving HTML: {e}")
-        return HTMLResponse(content="<h1>AI Image Analyzer API</h1><p>Upload an image to /analyze endpoint</p>")
+    return HTMLResponse(content=_INDEX_HTML)
+
+# Static part of the health payload, serialized once without its closing brace
+_HEALTH_BASE = orjson.dumps({
+    "status": "OK",
+    "message": "AI Image Analyzer API is running",
+    "framework": "FastAPI + LangChain",
+    "ai_model": "Google Gemini 1.5 Flash",
+    "api_key_configured": API_KEY_VALID,
+})[:-1]
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "OK",
-        "message": "AI Image Analyzer API is running",
-        "framework": "FastAPI + LangChain",
-        "ai_model": "Google Gemini 1.5 Flash",
-        "api_key_configured": bool(GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here"),
-        "timestamp": datetime.now().isoformat()
-    }
-
-@app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_image(request: ImageAnalysisRequest):
+    return Response(
+        content=_HEALTH_BASE + b',"timestamp":"' + now_iso().encode() + b'"}',
+        media_type="application/json"
+    )
+
+@app.post("/analyze", response_model=AnalysisResponse, response_class=ORJSONResponse)
+async def analyze_image(
+    request: ImageAnalysisRequest,
+    settings: Settings = Depends(get_settings),
+    image_agent: ImageAnalyzerAgent = Depends(get_image_agent),
+):
     """
     Analyze an uploaded image using LangChain agent and Gemini AI
     
     Args:
         request: ImageAnalysisRequest containing base64 image and mime type
+        settings: Application settings (injected)
+        image_agent: Analysis agent built from the injected settings
     
     Returns:
         AnalysisResponse with detailed image description
     """
     try:
         # Check if API key is configured (only warn in demo mode)
-        if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here":
-            if not DEMO_MODE:
+        if not settings.api_key_valid:
+            if not settings.DEMO_MODE:
                 raise HTTPException(
                     status_code=500,
                     detail="GEMINI_API_KEY not configured. Please add your API key to the .env file or set DEMO_MODE=true"
                 )
             logger.info("🎭 Running in DEMO MODE")
         
-        logger.info("📸 Starting image analysis with LangChain agent...")
+        # Demo mode - skip the agent and model validation entirely
+        if image_agent.demo_mode:
+            if not request.image:
+                raise ValueError("No image has been set for analysis")
+            logger.info("🎭 DEMO MODE: Generating mock analysis")
+            return demo_response()
         
-        # Set the image in the agent
-        image_agent.set_image(request.image, request.mime_type)
+        logger.info("📸 Starting image analysis with LangChain agent...")
         
-        # Run the agent analysis
-        description = image_agent.analyze()
+        # Run the agent analysis off the event loop
+        description = await asyncio.to_thread(image_agent.analyze, request.image, request.mime_type)
         
         logger.info("✅ Analysis complete")
         
-        agent_name = "LangChain + Gemini 1.5 Flash"
-        if DEMO_MODE and (not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here"):
-            agent_name = "DEMO MODE (Add API key for real analysis)"
-        
         return AnalysisResponse(
             success=True,
             description=description,
-            timestamp=datetime.now().isoformat(),
-            agent_used=agent_name
+            timestamp=now_iso(),
+            agent_used=AGENT_NAME_DEMO if image_agent.demo_mode else AGENT_NAME_REAL
         )
         
     except Exception as e:
-        logger.error(f"❌ Error analyzing image: {str(e)}")
+        logger.error("❌ Error analyzing image: %s", e)
         
         error_message = "Failed to analyze image"
         
@@ -370,21 +504,27 @@ async def analyze_image(request: ImageAnalysisRequest):
         
         raise HTTPException(status_code=500, detail=error_message)
 
-@app.post("/analyze-file")
-async def analyze_uploaded_file(file: UploadFile = File(...)):
+@app.post("/analyze-file", response_class=ORJSONResponse)
+async def analyze_uploaded_file(
+    file: UploadFile = File(...),
+    settings: Settings = Depends(get_settings),
+    image_agent: ImageAnalyzerAgent = Depends(get_image_agent),
+):
     """
     Analyze an uploaded image file directly
     
     Args:
         file: Uploaded image file
+        settings: Application settings (injected)
+        image_agent: Analysis agent built from the injected settings
     
     Returns:
         AnalysisResponse with detailed image description
     """
     try:
         # Check if API key is configured (only warn in demo mode)
-        if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here":
-            if not DEMO_MODE:
+        if not settings.api_key_valid:
+            if not settings.DEMO_MODE:
                 raise HTTPException(
                     status_code=500,
                     detail="GEMINI_API_KEY not configured. Please add your API key to the .env file or set DEMO_MODE=true"
@@ -395,35 +535,34 @@ async def analyze_uploaded_file(file: UploadFile = File(...)):
         if not file.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="File must be an image")
         
-        logger.info(f"📸 Analyzing uploaded file: {file.filename}")
+        # Demo mode - skip reading the file and model validation entirely
+        if image_agent.demo_mode:
+            if not file.size:
+                raise ValueError("No image has been set for analysis")
+            logger.info("🎭 DEMO MODE: Generating mock analysis")
+            return demo_response()
+        
+        logger.info("📸 Analyzing uploaded file: %s", file.filename)
         
         # Read and encode image
-        image_data = await file.read()
-        image_base64 = base64.b64encode(image_data).decode("utf-8")
-        
-        # Set the image in the agent
-        image_agent.set_image(image_base64, file.content_type)
+        image_base64 = base64.b64encode(await file.read()).decode("ascii")
         
-        # Run the agent analysis
-        description = image_agent.analyze()
+        # Run the agent analysis off the event loop
+        description = await asyncio.to_thread(image_agent.analyze, image_base64, file.content_type)
         
         logger.info("✅ Analysis complete")
         
-        agent_name = "LangChain + Gemini 1.5 Flash"
-        if DEMO_MODE and (not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here"):
-            agent_name = "DEMO MODE (Add API key for real analysis)"
-        
         return AnalysisResponse(
             success=True,
             description=description,
-            timestamp=datetime.now().isoformat(),
-            agent_used=agent_name
+            timestamp=now_iso(),
+            agent_used=AGENT_NAME_DEMO if image_agent.demo_mode else AGENT_NAME_REAL
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error analyzing file: {str(e)}")
+        logger.error("❌ Error analyzing file: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to analyze image: {str(e)}")
 
 # ============================================
@@ -431,35 +570,53 @@ async def analyze_uploaded_file(file: UploadFile = File(...)):
 # ============================================
 @app.on_event("startup")
 async def startup_event():
-    """Log startup information"""
+    """Start the timestamp refresher and log startup information"""
+    global _timestamp_task
+    _timestamp_task = asyncio.create_task(refresh_timestamp())
+    
     logger.info("")
     logger.info("🚀 ============================================")
     logger.info("   AI Image Analyzer - FastAPI + LangChain")
     logger.info("   ============================================")
-    logger.info(f"   📡 Server starting...")
-    logger.info(f"   🤖 AI Model: Google Gemini 1.5 Flash")
-    logger.info(f"   🔗 Framework: FastAPI + LangChain")
-    logger.info(f"   🔑 API Key: {'✅ Configured' if GEMINI_API_KEY and GEMINI_API_KEY != 'your_gemini_api_key_here' else '❌ Not configured'}")
+    logger.info("   📡 Server starting...")
+    logger.info("   🤖 AI Model: Google Gemini 1.5 Flash")
+    logger.info("   🔗 Framework: FastAPI + LangChain")
+    logger.info("   🔑 API Key: %s", "✅ Configured" if API_KEY_VALID else "❌ Not configured")
     logger.info("   ============================================")
     logger.info("")
     
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_api_key_here":
+    if not API_KEY_VALID:
         logger.warning("⚠️  WARNING: GEMINI_API_KEY not configured!")
         logger.warning("   Please add your API key to the .env file")
         logger.warning("")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the timestamp refresher"""
+    if _timestamp_task is not None:
+        _timestamp_task.cancel()
+
 # ============================================
 # MAIN ENTRY POINT
 # ============================================
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"🚀 Starting server on {settings.HOST}:{settings.PORT}")
-    logger.info(f"🐛 Debug mode: {settings.DEBUG}")
+    logger.info("🚀 Starting server on %s:%s", settings.HOST, settings.PORT)
+    logger.info("🐛 Debug mode: %s", settings.DEBUG)
+    
+    # Reload only works with a single worker process
+    reload = settings.DEBUG and settings.workers == 1
+    if settings.DEBUG and not reload:
+        logger.warning("⚠️  Auto-reload disabled: set WEB_CONCURRENCY=1 to enable it")
     
+    # "auto" picks uvloop/httptools when installed (not available on Windows)
     uvicorn.run(
         "src.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        workers=settings.workers,
+        loop="auto",
+        http="auto",
+        reload=reload
     )